@@ -1,22 +1,33 @@
 import os
-import json
+import sys
 import nltk
+import orjson
 import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import re
-from flask import Flask, request, jsonify
+import sqlite3
+import threading
+import hashlib
+import gzip
+from flask import Flask, request
 from flask_cors import CORS
-from nltk.tokenize import word_tokenize
 from nltk.corpus import stopwords
 from nltk.stem import WordNetLemmatizer
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+from sklearn.pipeline import Pipeline
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from collections import OrderedDict, Counter, defaultdict
 import random
+import joblib
+from scipy.sparse import save_npz, load_npz
 
 # Ensure NLTK data is downloaded
-nltk.download('punkt', quiet=True)
 nltk.download('wordnet', quiet=True)
 nltk.download('stopwords', quiet=True)
 
@@ -25,9 +36,23 @@ CORS(app)  # Enable CORS for all routes
 
 # Constants
 DATA_FILE = "movie_data.json"
+PROGRESS_FILE = "movie_data.jsonl"  # Checkpoints appended while fetching, one movie per line
 API_KEY_FILE = "tmdb_api_key.txt"
+CACHE_FILE = "tmdb_cache.sqlite"
+TFIDF_MATRIX_FILE = "tfidf_matrix.npz"  # Built from DATA_FILE, reused until it changes
+VECTORIZER_FILE = "tfidf_vectorizer.joblib"
+CACHE_TTL = 7 * 86400  # Seconds before a cached TMDB response is refetched
+CACHE_MEMORY_SIZE = 1024  # Most recently used TMDB responses also kept decoded in memory
+RECOMMEND_CACHE_SIZE = 1024  # Most recent /api/recommend responses kept serialized in memory
+RECOMMEND_CACHE_MAX_N = 50  # Larger requests are answered uncached, so each cached body stays small
+MAX_BATCH_QUERIES = 50  # Queries accepted by one /api/recommend_batch call
 TMDB_BASE_URL = "https://api.themoviedb.org/3"
 TARGET_MOVIE_COUNT = 4719  # Updated to 8000 total
+MAX_CONCURRENT_REQUESTS = 32  # Parallel TMDB requests while fetching
+MAX_RETRIES = 5  # Retries per TMDB request on rate limiting / server errors
+PERSON_CREDITS_BATCH = 128  # Credited movies fetched between category target checks
+HASHING_FEATURES = 2 ** 18  # Hashed term buckets for the TF-IDF vectors
+TOKEN_PATTERN = re.compile(r'[^\W\d]+')  # Runs of letters, i.e. word characters other than digits
 
 # Target distribution
 HOLLYWOOD_COUNT = 2500
@@ -35,16 +60,205 @@ BOLLYWOOD_COUNT = 1000
 SOUTH_INDIAN_COUNT = 500 
 WEB_SERIES_COUNT = 500  # Both Hollywood and Bollywood web series
 
+# Shared text processing resources, built once per process
+_STOPS = frozenset(stopwords.words('english'))
+_LEMMA = WordNetLemmatizer()
+
+@lru_cache(maxsize=200_000)
+def _lem(token):
+    """Lemmatize a token, memoized since the same words recur across documents"""
+    return _LEMMA.lemmatize(token)
+
+def _preprocess_text(text):
+    """Preprocess text for better NLP performance (module level so worker processes can run it)"""
+    if not text:
+        return ""
+        
+    # Lowercase and tokenize in one regex scan; special characters and digits split tokens
+    tokens = TOKEN_PATTERN.findall(text.lower())
+    
+    # Remove stop words and lemmatize
+    tokens = [_lem(token) for token in tokens if token not in _STOPS]
+    
+    return ' '.join(tokens)
+
+# Search document tags by original language
+LANG_TAGS = {
+    'en': "english hollywood international",
+    'hi': "hindi bollywood indian",
+    'ta': "tamil south indian",
+    'te': "telugu south indian",
+    'ml': "malayalam south indian",
+    'kn': "kannada south indian"
+}
+# Original languages counted as South Indian cinema
+SOUTH_INDIAN_LANGUAGES = ['ta', 'te', 'ml', 'kn']
+# Request fields of /api/recommend that override filters extracted from the query
+FILTER_KEYS = ('year', 'genre', 'language', 'content_type')
+# Display names for the language codes listed by /api/filters
+LANGUAGE_NAMES = {
+    'en': 'English',
+    'hi': 'Hindi',
+    'ta': 'Tamil',
+    'te': 'Telugu',
+    'ml': 'Malayalam',
+    'kn': 'Kannada'
+}
+# Search document tags for streaming networks, by a substring of the network name; the first match wins
+PLATFORM_TAGS = {
+    'netflix': "netflix ott streaming",
+    'amazon': "amazon prime video ott streaming",
+    'prime': "amazon prime video ott streaming",
+    'disney': "disney+ hotstar ott streaming",
+    'hotstar': "disney+ hotstar ott streaming",
+    'hbo': "hbo max ott streaming",
+    'hulu': "hulu ott streaming",
+    'zee': "zee5 ott streaming",
+    'sony': "sonyliv ott streaming",
+    'alt': "altbalaji ott streaming",
+    'balaji': "altbalaji ott streaming"
+}
+
+# Query intent keywords; when several match, the first listed wins
+GENRE_KEYWORDS = ["action", "comedy", "drama", "horror", "sci-fi", "romance", "thriller", 
+                  "adventure", "fantasy", "animation", "documentary", "biography"]
+REGION_KEYWORDS = {
+    "hollywood": "en",
+    "bollywood": "hi",
+    "hindi": "hi",
+    "tamil": "ta",
+    "telugu": "te",
+    "malayalam": "ml", 
+    "kannada": "kn",
+    "south indian": ["ta", "te", "ml", "kn"],
+    "indian": ["hi", "ta", "te", "ml", "kn"]
+}
+CONTENT_TYPE_KEYWORDS = {
+    "movie": "movie",
+    "film": "movie",
+    "web series": "tv",
+    "tv series": "tv",
+    "show": "tv",
+    "television": "tv",
+    "ott": "tv",
+    "streaming": "tv"
+}
+FEELING_KEYWORDS = {
+    # Map feelings to genres/keywords
+    "happy": ["comedy", "feel-good", "uplifting"],
+    "sad": ["drama", "tragedy", "emotional"],
+    "scary": ["horror", "thriller", "suspense"],
+    "exciting": ["action", "adventure", "thriller"],
+    "thoughtful": ["drama", "philosophical", "thought-provoking"],
+    "romantic": ["romance", "love story", "romantic comedy"]
+}
+
+def _keyword_pattern(keywords):
+    """Compile one whole-word alternation over the keywords, longest first"""
+    return re.compile(r'\b(' + '|'.join(re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True)) + r')\b')
+
+YEAR_RE = re.compile(r'\b(19\d{2}|20\d{2})\b')
+GENRE_RE = _keyword_pattern(GENRE_KEYWORDS)
+REGION_RE = _keyword_pattern(REGION_KEYWORDS)
+CONTENT_TYPE_RE = _keyword_pattern(CONTENT_TYPE_KEYWORDS)
+FEELING_RE = _keyword_pattern(FEELING_KEYWORDS)
+
+def _first_keyword(pattern, keywords, text):
+    """Return the first of the keywords (in their listed order) found in text, or None"""
+    found = set(pattern.findall(text))
+    return next((keyword for keyword in keywords if keyword in found), None)
+
+class TMDBCache:
+    """SQLite store of raw TMDB JSON responses keyed by request URL (the API key is sent separately), fronted by a small in-memory LRU"""
+    def __init__(self, path=CACHE_FILE, ttl=CACHE_TTL, memory_size=CACHE_MEMORY_SIZE):
+        self.ttl = ttl
+        self.memory_size = memory_size
+        self._lock = threading.Lock()  # Shared by the fetch worker threads
+        self._recent = OrderedDict()  # key -> (synced_at, data), least recently used first
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, synced_at REAL, body TEXT)")
+        self._conn.commit()
+    
+    def get(self, url):
+        """Return (data, is_fresh) for a cached URL, or (None, False) on a miss"""
+        with self._lock:
+            entry = self._recent.get(url)
+            if entry is not None:
+                self._recent.move_to_end(url)
+            else:
+                row = self._conn.execute("SELECT synced_at, body FROM responses WHERE key = ?", (url,)).fetchone()
+                if row is None:
+                    return None, False
+                entry = (row[0], orjson.loads(row[1]))
+                self._remember(url, entry)
+        synced_at, data = entry
+        return data, time.time() - synced_at < self.ttl
+    
+    def set(self, url, data):
+        """Store the JSON response for a URL with the current timestamp"""
+        synced_at = time.time()
+        body = orjson.dumps(data)
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO responses (key, synced_at, body) VALUES (?, ?, ?)", (url, synced_at, body))
+            self._conn.commit()
+            self._remember(url, (synced_at, data))
+    
+    def _remember(self, key, entry):
+        """Keep a decoded response in memory, evicting the least recently used past memory_size (lock held)"""
+        self._recent[key] = entry
+        self._recent.move_to_end(key)
+        if len(self._recent) > self.memory_size:
+            self._recent.popitem(last=False)
+
+class RateLimiter:
+    """Paces TMDB requests by the X-RateLimit-* headers of the latest response"""
+    def __init__(self):
+        self._lock = threading.Lock()  # Shared by the fetch worker threads
+        self.remaining = None  # Requests left in the current window, unknown until TMDB reports it
+        self.reset_at = 0.0  # Epoch seconds when the window refills
+    
+    def acquire(self):
+        """Take one request from the current window, sleeping until it refills if it is used up"""
+        with self._lock:
+            if self.remaining is None:
+                return
+            if self.remaining <= 0:
+                delay = self.reset_at - time.time()
+                if delay > 0:
+                    time.sleep(delay)  # Holding the lock makes every worker wait for the reset
+                self.remaining = None
+            else:
+                self.remaining -= 1
+    
+    def update(self, headers):
+        """Refresh the window from a response's rate limit headers, if TMDB sent them"""
+        try:
+            remaining = int(headers['X-RateLimit-Remaining'])
+            reset_at = float(headers['X-RateLimit-Reset'])
+        except (KeyError, ValueError):
+            return
+        with self._lock:
+            self.remaining = remaining
+            self.reset_at = reset_at
+
 class MovieRecommender:
     def __init__(self):
         self.movies = []
         self.tfidf_matrix = None
+        self.term_matrix = None  # Transposed TF-IDF matrix: row t lists the movies containing term t
         self.vectorizer = None
+        self._genre_names = None  # TMDB genre id -> name, fetched on first use
         self.api_key = self._load_api_key()
+        self.session = self._create_session()
+        self.limiter = RateLimiter()
+        self.cache = TMDBCache()  # Raw TMDB responses, reused across runs
         self.unique_movie_ids = set()  # To track unique movies
+        self.movies_by_id = {}  # TMDB id -> movie, for direct lookups
+        self._reset_columns()  # Per-movie filter fields, parallel to self.movies, for vectorized filters and counts
+        self._progress_fp = None  # Append handle on PROGRESS_FILE, opened by the first checkpoint
         
-        # Load existing data or fetch new data
-        if os.path.exists(DATA_FILE):
+        # Load existing data (including checkpoints of an interrupted fetch) or fetch new data
+        if os.path.exists(DATA_FILE) or os.path.exists(PROGRESS_FILE):
             self._load_data()
             # If loaded data is less than target, fetch more
             if len(self.movies) < TARGET_MOVIE_COUNT:
@@ -64,20 +278,52 @@ class MovieRecommender:
             print(f"Error: {API_KEY_FILE} not found. Please create this file with your TMDB API key.")
             return "YOUR_API_KEY_HERE"  # Placeholder for testing
     
+    def _create_session(self):
+        """Create an HTTP session that reuses TMDB connections and retries transient failures"""
+        session = requests.Session()
+        session.params = {'api_key': self.api_key}  # Added to every request, so URLs never carry the key
+        # Backs off exponentially on 429/5xx and honors Retry-After on 429
+        retries = Retry(total=MAX_RETRIES, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=retries)
+        session.mount('https://', adapter)
+        return session
+    
     def _load_data(self):
-        """Load movie data from JSON file"""
+        """Load movie data from JSON file, plus any checkpointed movies not yet merged into it"""
         print("Loading existing movie data...")
-        with open(DATA_FILE, 'r', encoding='utf-8') as f:
-            self.movies = json.load(f)
-        # Populate the unique IDs set
-        self.unique_movie_ids = set(movie['id'] for movie in self.movies)
+        self.movies = []
+        if os.path.exists(DATA_FILE):
+            with open(DATA_FILE, 'rb') as f:
+                self.movies = orjson.loads(f.read())
+        # Populate the unique IDs set and filter columns
+        self.unique_movie_ids = {movie['id'] for movie in self.movies}
+        self.movies_by_id = {movie['id']: movie for movie in self.movies}
+        self._reset_columns()
+        self._index_columns(self.movies)
+        
+        recovered = 0
+        if os.path.exists(PROGRESS_FILE):
+            checkpointed = []
+            with open(PROGRESS_FILE, 'rb') as f:
+                for line in f:
+                    try:
+                        checkpointed.append(orjson.loads(line))
+                    except orjson.JSONDecodeError:
+                        continue  # Partially written last line of an interrupted run
+            recovered = self._ingest(checkpointed, checkpoint=False)
+        
         print(f"Loaded {len(self.movies)} movies")
+        if recovered:
+            print(f"Recovered {recovered} movies from {PROGRESS_FILE}")
+            self._save_data()
     
     def _fetch_and_process_data(self):
         """Fetch a large dataset of movies from TMDB API using multiple methods"""
         print(f"Fetching {TARGET_MOVIE_COUNT} movies from TMDB API...")
         self.movies = []
         self.unique_movie_ids = set()
+        self.movies_by_id = {}
+        self._reset_columns()
         
         # Get list of all available genres
         genres = self._get_genres()
@@ -155,36 +401,15 @@ class MovieRecommender:
         bollywood_fetched = 0
         
         # 2.1 Using discover endpoint with Hindi language parameter
-        page = 1
-        while bollywood_fetched < BOLLYWOOD_COUNT:
-            url = f"{TMDB_BASE_URL}/discover/movie?api_key={self.api_key}&with_original_language=hi&page={page}&sort_by=popularity.desc"
-            try:
-                response = requests.get(url)
-                if response.status_code == 200:
-                    data = response.json()
-                    results = data.get('results', [])
-                    if not results:
-                        break
-                        
-                    before_count = len(self.unique_movie_ids)
-                    self._process_movie_results(results, is_bollywood=True)
-                    after_count = len(self.unique_movie_ids)
-                    bollywood_fetched += (after_count - before_count)
-                        
-                    self._save_progress(f"Bollywood movies (page {page})")
-                    page += 1
-                    time.sleep(0.5)  # Prevent rate limiting
-                        
-                    # Break if we've reached end of results
-                    if page > data.get('total_pages', 1) or page > 100:  # Allow up to 100 pages
-                        break
-                else:
-                    print(f"Error {response.status_code} when fetching Bollywood movies")
-                    time.sleep(2)
-            except Exception as e:
-                print(f"Exception while fetching Bollywood movies: {e}")
-                time.sleep(2)
-                
+        url = f"{TMDB_BASE_URL}/discover/movie?with_original_language=hi&sort_by=popularity.desc"
+        for page, results in self._fetch_pages(url, max_pages=100):  # Allow up to 100 pages
+            if bollywood_fetched >= BOLLYWOOD_COUNT:
+                break
+
+            bollywood_fetched += self._process_movie_results(results, is_bollywood=True)
+
+            self._save_progress(f"Bollywood movies (page {page})")
+
         print(f"Fetched {bollywood_fetched} Bollywood movies")
         
         # 2.2 Fetch by popular Bollywood studios/production companies
@@ -206,30 +431,11 @@ class MovieRecommender:
                     break
                     
                 # Use a more targeted approach that combines company and language
-                url = f"{TMDB_BASE_URL}/discover/movie?api_key={self.api_key}&with_companies={studio_id}&with_original_language=hi&page=1&sort_by=popularity.desc"
-                try:
-                    response = requests.get(url)
-                    if response.status_code == 200:
-                        data = response.json()
-                        total_pages = min(data.get('total_pages', 1), 10)  # Limit to 10 pages per studio
-                        
-                        for page in range(1, total_pages + 1):
-                            if page > 1:  # Skip first page as we already fetched it
-                                url = f"{TMDB_BASE_URL}/discover/movie?api_key={self.api_key}&with_companies={studio_id}&with_original_language=hi&page={page}&sort_by=popularity.desc"
-                                response = requests.get(url)
-                                if response.status_code != 200:
-                                    continue
-                                data = response.json()
-                                
-                            before_count = len(self.unique_movie_ids)
-                            self._process_movie_results(data.get('results', []), is_bollywood=True)
-                            after_count = len(self.unique_movie_ids)
-                            bollywood_fetched += (after_count - before_count)
-                            
-                            self._save_progress(f"Bollywood studio {studio_id} (page {page})")
-                            time.sleep(0.5)
-                except Exception as e:
-                    print(f"Error fetching from Bollywood studio {studio_id}: {e}")
+                url = f"{TMDB_BASE_URL}/discover/movie?with_companies={studio_id}&with_original_language=hi&sort_by=popularity.desc"
+                for page, results in self._fetch_pages(url, max_pages=10):  # Limit to 10 pages per studio
+                    bollywood_fetched += self._process_movie_results(results, is_bollywood=True)
+
+                    self._save_progress(f"Bollywood studio {studio_id} (page {page})")
         
         # 2.3 Fetch using search for popular Bollywood actors
         if bollywood_fetched < BOLLYWOOD_COUNT:
@@ -241,50 +447,24 @@ class MovieRecommender:
                 "Ajay Devgn", "Shahid Kapoor", "Varun Dhawan", "Sanjay Dutt"
             ]
             
-            for actor in bollywood_actors:
+            # Look up every actor and their credits concurrently, then filter their movies
+            movie_ids = self._get_person_movie_ids(bollywood_actors)
+            for start in range(0, len(movie_ids), PERSON_CREDITS_BATCH):
                 if bollywood_fetched >= BOLLYWOOD_COUNT:
                     break
-                    
-                # Search for actor and then filter their movies
-                search_url = f"{TMDB_BASE_URL}/search/person?api_key={self.api_key}&query={actor.replace(' ', '+')}"
-                try:
-                    response = requests.get(search_url)
-                    if response.status_code == 200:
-                        data = response.json()
-                        results = data.get('results', [])
-                        
-                        if results:
-                            person_id = results[0].get('id')
-                            if person_id:
-                                # Get movies the actor was in
-                                credits_url = f"{TMDB_BASE_URL}/person/{person_id}/movie_credits?api_key={self.api_key}"
-                                credits_response = requests.get(credits_url)
-                                
-                                if credits_response.status_code == 200:
-                                    credits_data = credits_response.json()
-                                    cast_movies = credits_data.get('cast', [])
-                                    
-                                    before_count = len(self.unique_movie_ids)
-                                    # Process movies, favoring Hindi language
-                                    for movie in cast_movies:
-                                        movie_id = movie.get('id')
-                                        if movie_id and movie_id not in self.unique_movie_ids:
-                                            try:
-                                                movie_details = self._get_movie_details(movie_id, prefer_hindi=True)
-                                                if movie_details and movie_details.get('language') == 'hi':
-                                                    # Add the 'bollywood' tag to make searching easier
-                                                    movie_details['document'] += " bollywood hindi indian"
-                                                    self.movies.append(movie_details)
-                                                    self.unique_movie_ids.add(movie_id)
-                                                    time.sleep(0.1)
-                                            except Exception as e:
-                                                print(f"Error processing Bollywood movie {movie_id}: {e}")
-                                                
-                                    after_count = len(self.unique_movie_ids)
-                                    bollywood_fetched += (after_count - before_count)
-                                    self._save_progress(f"Bollywood actor {actor}")
-                except Exception as e:
-                    print(f"Error fetching movies for Bollywood actor {actor}: {e}")
+
+                batch = movie_ids[start:start + PERSON_CREDITS_BATCH]
+                all_details = self._map_concurrent(lambda movie_id: self._get_movie_details(movie_id, prefer_hindi=True), batch)
+
+                # Process movies, favoring Hindi language
+                hindi_movies = [movie_details for movie_details in all_details
+                                if movie_details and movie_details.get('language') == 'hi']
+                for movie_details in hindi_movies:
+                    # Add the 'bollywood' tag to make searching easier
+                    movie_details['document'] += " bollywood hindi indian"
+                bollywood_fetched += self._ingest(hindi_movies)
+
+                self._save_progress(f"Bollywood actor credits ({start + len(batch)}/{len(movie_ids)})")
             
         # 3. Fetch South Indian movies (Tamil, Telugu, Malayalam, Kannada)
         print(f"Phase 3: Fetching South Indian movies (target: {SOUTH_INDIAN_COUNT})...")
@@ -300,40 +480,19 @@ class MovieRecommender:
         for language_code, language_name in south_indian_languages.items():
             language_target = SOUTH_INDIAN_COUNT // len(south_indian_languages)
             language_count = 0
-            page = 1
-                    
-            while language_count < language_target and south_indian_fetched < SOUTH_INDIAN_COUNT:
-                url = f"{TMDB_BASE_URL}/discover/movie?api_key={self.api_key}&with_original_language={language_code}&page={page}&sort_by=popularity.desc"
-                try:
-                    response = requests.get(url)
-                    if response.status_code == 200:
-                        data = response.json()
-                        results = data.get('results', [])
-                        if not results:
-                            break
-                                
-                        before_count = len(self.unique_movie_ids)
-                        # Add tag for the language to make searching easier
-                        for result in results:
-                            result['language_tag'] = language_name.lower() + " south indian"
-                            
-                        self._process_movie_results(results, is_south_indian=True, language=language_name)
-                        after_count = len(self.unique_movie_ids)
-                        language_count += (after_count - before_count)
-                        south_indian_fetched += (after_count - before_count)
-                                
-                        self._save_progress(f"{language_name} movies (page {page})")
-                        page += 1
-                        time.sleep(0.5)
-                                
-                        if page > data.get('total_pages', 1) or page > 20:  # Increased to 20 pages to get more results
-                            break
-                    else:
-                        print(f"Error {response.status_code} when fetching {language_name} movies")
-                        time.sleep(2)
-                except Exception as e:
-                    print(f"Exception while fetching {language_name} movies: {e}")
-                    time.sleep(2)
+
+            url = f"{TMDB_BASE_URL}/discover/movie?with_original_language={language_code}&sort_by=popularity.desc"
+            for page, results in self._fetch_pages(url, max_pages=20):  # Increased to 20 pages to get more results
+                if language_count >= language_target or south_indian_fetched >= SOUTH_INDIAN_COUNT:
+                    break
+
+                # Tag the language to make searching easier
+                added = self._process_movie_results(results, is_south_indian=True, language=language_name,
+                                                    tags=language_name.lower() + " south indian")
+                language_count += added
+                south_indian_fetched += added
+
+                self._save_progress(f"{language_name} movies (page {page})")
                     
         # 3.2 Fetch by top South Indian actors/directors
         if south_indian_fetched < SOUTH_INDIAN_COUNT:
@@ -350,51 +509,24 @@ class MovieRecommender:
                 "Yash", "Sudeep", "Darshan", "Puneeth Rajkumar", "Upendra"
             ]
             
-            for personality in south_indian_personalities:
+            # Get both acting and directing credits for every personality concurrently
+            movie_ids = self._get_person_movie_ids(south_indian_personalities, include_crew=True)
+            for start in range(0, len(movie_ids), PERSON_CREDITS_BATCH):
                 if south_indian_fetched >= SOUTH_INDIAN_COUNT:
                     break
-                    
-                # Search for person
-                search_url = f"{TMDB_BASE_URL}/search/person?api_key={self.api_key}&query={personality.replace(' ', '+')}"
-                try:
-                    response = requests.get(search_url)
-                    if response.status_code == 200:
-                        data = response.json()
-                        results = data.get('results', [])
-                        
-                        if results:
-                            person_id = results[0].get('id')
-                            if person_id:
-                                # Get movies the person was in
-                                credits_url = f"{TMDB_BASE_URL}/person/{person_id}/movie_credits?api_key={self.api_key}"
-                                credits_response = requests.get(credits_url)
-                                
-                                if credits_response.status_code == 200:
-                                    credits_data = credits_response.json()
-                                    # Get both acting and directing credits
-                                    all_movies = credits_data.get('cast', []) + credits_data.get('crew', [])
-                                    
-                                    before_count = len(self.unique_movie_ids)
-                                    # Process movies, but filter for South Indian languages
-                                    for movie in all_movies:
-                                        movie_id = movie.get('id')
-                                        if movie_id and movie_id not in self.unique_movie_ids:
-                                            try:
-                                                movie_details = self._get_movie_details(movie_id)
-                                                if movie_details and movie_details.get('language') in ["ta", "te", "ml", "kn"]:
-                                                    # Add south indian tag for easier searching
-                                                    movie_details['document'] += " south indian"
-                                                    self.movies.append(movie_details)
-                                                    self.unique_movie_ids.add(movie_id)
-                                                    time.sleep(0.1)
-                                            except Exception as e:
-                                                print(f"Error processing South Indian movie {movie_id}: {e}")
-                                                
-                                    after_count = len(self.unique_movie_ids)
-                                    south_indian_fetched += (after_count - before_count)
-                                    self._save_progress(f"South Indian personality {personality}")
-                except Exception as e:
-                    print(f"Error fetching movies for South Indian personality {personality}: {e}")
+
+                batch = movie_ids[start:start + PERSON_CREDITS_BATCH]
+                all_details = self._map_concurrent(self._get_movie_details, batch)
+
+                # Process movies, but filter for South Indian languages
+                regional_movies = [movie_details for movie_details in all_details
+                                   if movie_details and movie_details.get('language') in ["ta", "te", "ml", "kn"]]
+                for movie_details in regional_movies:
+                    # Add south indian tag for easier searching
+                    movie_details['document'] += " south indian"
+                south_indian_fetched += self._ingest(regional_movies)
+
+                self._save_progress(f"South Indian personality credits ({start + len(batch)}/{len(movie_ids)})")
         
         # 4. Fetch web series (TV shows) - both Hollywood and Bollywood
         print(f"Phase 4: Fetching web series (target: {WEB_SERIES_COUNT})...")
@@ -403,96 +535,35 @@ class MovieRecommender:
         # 4.1 Fetch popular Hollywood web series first (60% of web series target)
         hollywood_series_target = int(WEB_SERIES_COUNT * 0.6)
         hollywood_series_count = 0
-        page = 1
-        
-        while hollywood_series_count < hollywood_series_target:
-            url = f"{TMDB_BASE_URL}/tv/popular?api_key={self.api_key}&page={page}"
-            try:
-                response = requests.get(url)
-                if response.status_code == 200:
-                    data = response.json()
-                    results = data.get('results', [])
-                    if not results:
-                        break
-                    
-                    # Process TV shows similar to movies
-                    before_count = len(self.unique_movie_ids)
-                    for show in results:
-                        if show.get('id') and show['id'] not in self.unique_movie_ids:
-                            try:
-                                show_details = self._get_tv_details(show['id'])
-                                if show_details:
-                                    # Add 'web series' tag for easier searching
-                                    show_details['document'] += " web series tv show"
-                                    self.movies.append(show_details)
-                                    self.unique_movie_ids.add(show['id'])
-                                    time.sleep(0.1)  # Prevent rate limiting
-                            except Exception as e:
-                                print(f"Error processing TV show {show.get('id')}: {e}")
-                    
-                    after_count = len(self.unique_movie_ids)
-                    hollywood_series_count += (after_count - before_count)
-                    web_series_fetched += (after_count - before_count)
-                    
-                    self._save_progress(f"Popular web series (page {page})")
-                    page += 1
-                    time.sleep(0.5)
-                    
-                    if page > data.get('total_pages', 1) or page > 15:  # Limit to 15 pages
-                        break
-                else:
-                    print(f"Error {response.status_code} when fetching popular web series")
-                    time.sleep(2)
-            except Exception as e:
-                print(f"Exception while fetching popular web series: {e}")
-                time.sleep(2)
-        
+
+        url = f"{TMDB_BASE_URL}/tv/popular"
+        for page, results in self._fetch_pages(url, max_pages=15):  # Limit to 15 pages
+            if hollywood_series_count >= hollywood_series_target:
+                break
+
+            # Process TV shows similar to movies, adding 'web series' tag for easier searching
+            added = self._process_tv_results(results, "web series tv show")
+            hollywood_series_count += added
+            web_series_fetched += added
+
+            self._save_progress(f"Popular web series (page {page})")
+
         # 4.2 Fetch Hindi (Bollywood) web series specifically (40% of web series target)
         bollywood_series_target = WEB_SERIES_COUNT - hollywood_series_count
         bollywood_series_count = 0
-        page = 1
-        
-        while bollywood_series_count < bollywood_series_target:
-            url = f"{TMDB_BASE_URL}/discover/tv?api_key={self.api_key}&with_original_language=hi&page={page}&sort_by=popularity.desc"
-            try:
-                response = requests.get(url)
-                if response.status_code == 200:
-                    data = response.json()
-                    results = data.get('results', [])
-                    if not results:
-                        break
-                    
-                    before_count = len(self.unique_movie_ids)
-                    for show in results:
-                        if show.get('id') and show['id'] not in self.unique_movie_ids:
-                            try:
-                                show_details = self._get_tv_details(show['id'])
-                                if show_details:
-                                    # Add 'bollywood web series' tag for easier searching
-                                    show_details['document'] += " bollywood hindi indian web series tv show"
-                                    self.movies.append(show_details)
-                                    self.unique_movie_ids.add(show['id'])
-                                    time.sleep(0.1)
-                            except Exception as e:
-                                print(f"Error processing Hindi TV show {show.get('id')}: {e}")
-                    
-                    after_count = len(self.unique_movie_ids)
-                    bollywood_series_count += (after_count - before_count)
-                    web_series_fetched += (after_count - before_count)
-                    
-                    self._save_progress(f"Hindi web series (page {page})")
-                    page += 1
-                    time.sleep(0.5)
-                    
-                    if page > data.get('total_pages', 1) or page > 30:  # Increased to 30 pages to get more results
-                        break
-                else:
-                    print(f"Error {response.status_code} when fetching Hindi web series")
-                    time.sleep(2)
-            except Exception as e:
-                print(f"Exception while fetching Hindi web series: {e}")
-                time.sleep(2)
-        
+
+        url = f"{TMDB_BASE_URL}/discover/tv?with_original_language=hi&sort_by=popularity.desc"
+        for page, results in self._fetch_pages(url, max_pages=30):  # Increased to 30 pages to get more results
+            if bollywood_series_count >= bollywood_series_target:
+                break
+
+            # Add 'bollywood web series' tag for easier searching
+            added = self._process_tv_results(results, "bollywood hindi indian web series tv show")
+            bollywood_series_count += added
+            web_series_fetched += added
+
+            self._save_progress(f"Hindi web series (page {page})")
+
         # If we still need more Hindi web series, try OTT platforms
         if bollywood_series_count < bollywood_series_target:
             ott_platforms = [
@@ -510,39 +581,19 @@ class MovieRecommender:
                 if bollywood_series_count >= bollywood_series_target:
                     break
                     
-                url = f"{TMDB_BASE_URL}/discover/tv?api_key={self.api_key}&with_networks={platform}&with_original_language=hi&page=1"
-                try:
-                    response = requests.get(url)
-                    if response.status_code == 200:
-                        data = response.json()
-                        results = data.get('results', [])
-                        
-                        before_count = len(self.unique_movie_ids)
-                        for show in results:
-                            if show.get('id') and show['id'] not in self.unique_movie_ids:
-                                try:
-                                    show_details = self._get_tv_details(show['id'])
-                                    if show_details:
-                                        show_details['document'] += " bollywood hindi indian web series tv show"
-                                        self.movies.append(show_details)
-                                        self.unique_movie_ids.add(show['id'])
-                                        time.sleep(0.1)
-                                except Exception as e:
-                                    print(f"Error processing OTT TV show {show.get('id')}: {e}")
-                        
-                        after_count = len(self.unique_movie_ids)
-                        bollywood_series_count += (after_count - before_count)
-                        web_series_fetched += (after_count - before_count)
-                        
-                        self._save_progress(f"OTT platform {platform}")
-                except Exception as e:
-                    print(f"Error fetching from OTT platform {platform}: {e}")
+                url = f"{TMDB_BASE_URL}/discover/tv?with_networks={platform}&with_original_language=hi&page=1"
+                data = self._fetch_json(url)
+                if data:
+                    added = self._process_tv_results(data.get('results', []), "bollywood hindi indian web series tv show")
+                    bollywood_series_count += added
+                    web_series_fetched += added
+
+                    self._save_progress(f"OTT platform {platform}")
                 
         print(f"Fetched {web_series_fetched} web series total")
         
         # Final save
-        with open(DATA_FILE, 'w', encoding='utf-8') as f:
-            json.dump(self.movies, f, ensure_ascii=False, indent=2)
+        self._save_data()
             
         elapsed_time = (time.time() - start_time) / 60
         
@@ -565,23 +616,11 @@ class MovieRecommender:
         needed = TARGET_MOVIE_COUNT - current_count
         
         # Count movies by category in current dataset
-        hollywood_count = 0
-        bollywood_count = 0
-        south_indian_count = 0
-        web_series_count = 0
-        
-        for movie in self.movies:
-            content_type = movie.get('content_type', 'movie')
-            language = movie.get('language', 'unknown')
-            
-            if content_type == 'tv':
-                web_series_count += 1
-            elif language == 'hi':
-                bollywood_count += 1
-            elif language in ['ta', 'te', 'ml', 'kn']:
-                south_indian_count += 1
-            else:
-                hollywood_count += 1
+        is_movie = self.movie_content_types != 'tv'
+        web_series_count = int((~is_movie).sum())
+        bollywood_count = int((is_movie & (self.movie_languages == 'hi')).sum())
+        south_indian_count = int((is_movie & np.isin(self.movie_languages, SOUTH_INDIAN_LANGUAGES)).sum())
+        hollywood_count = len(self.movies) - web_series_count - bollywood_count - south_indian_count
         
         print(f"\nCurrent counts:")
         print(f"- Hollywood/International: {hollywood_count}")
@@ -620,23 +659,9 @@ class MovieRecommender:
             pages = min(20, need_web_series // 20 + 1)
             
             # Popular TV shows
-            url = f"{TMDB_BASE_URL}/tv/popular?api_key={self.api_key}&page=1"
-            for page in range(1, pages + 1):
-            
-                    response = requests.get(url.replace("page=1", f"page={page}"))
-                    if response.status_code == 200:
-                        data = response.json()
-                        for show in data.get('results', []):
-                            if show.get('id') and show['id'] not in self.unique_movie_ids:
-                                try:
-                                    show_details = self._get_tv_details(show['id'])
-                                    if show_details:
-                                        show_details['document'] += " web series tv show"
-                                        self.movies.append(show_details)
-                                        self.unique_movie_ids.add(show['id'])
-                                        time.sleep(0.1)
-                                except Exception as e:
-                                    print(f"Error processing TV show {show.get('id')}: {e}")
+            url = f"{TMDB_BASE_URL}/tv/popular"
+            for page, results in self._fetch_pages(url, max_pages=pages):
+                self._process_tv_results(results, "web series tv show")
         
         # Finally, fetch more Hollywood movies if needed
         if need_hollywood > 0:
@@ -649,188 +674,290 @@ class MovieRecommender:
             for year in years_to_try:
                 if len(self.unique_movie_ids) >= TARGET_MOVIE_COUNT:
                     break
-                self._fetch_by_year(year, max_pages=2, strict_year=True)
+                # Listing fields are enough for filler movies; skip their detail requests
+                self._fetch_by_year(year, max_pages=2, strict_year=True, need_full_details=False)
         
         # Save final dataset
-        with open(DATA_FILE, 'w', encoding='utf-8') as f:
-            json.dump(self.movies, f, ensure_ascii=False, indent=2)
+        self._save_data()
             
         print(f"Dataset updated to {len(self.movies)} movies/shows")
     
     def _get_genres(self):
         """Get list of all available movie genres from TMDB"""
-        url = f"{TMDB_BASE_URL}/genre/movie/list?api_key={self.api_key}"
+        url = f"{TMDB_BASE_URL}/genre/movie/list"
+        data = self._fetch_json(url)
+        return data.get('genres', []) if data else []
+    
+    def _fetch_json(self, url):
+        """Return the JSON for a TMDB URL, served from the disk cache while it is fresh"""
+        cached, is_fresh = self.cache.get(url)
+        if is_fresh:
+            return cached
+        
+        data = self._request_json(url)
+        if data is None:
+            return cached  # Fall back to a stale copy while TMDB is unavailable
+        self.cache.set(url, data)
+        return data
+    
+    def _request_json(self, url):
+        """GET a TMDB URL on the pooled session and return its JSON (retries happen in the adapter)"""
+        endpoint = url.split('?')[0].replace(TMDB_BASE_URL, '')  # Keep the API key out of logs
         try:
-            response = requests.get(url)
+            self.limiter.acquire()
+            response = self.session.get(url, timeout=10)
+            self.limiter.update(response.headers)
             if response.status_code == 200:
-                return response.json().get('genres', [])
-            else:
-                print(f"Error {response.status_code} when fetching genres")
-                return []
+                return response.json()
+            print(f"Error {response.status_code} when fetching {endpoint}")
         except Exception as e:
-            print(f"Exception while fetching genres: {e}")
+            message = str(e)
+            if self.api_key:  # Replacing '' would put *** between every character
+                message = message.replace(self.api_key, '***')
+            print(f"Exception while fetching {endpoint}: {message}")
+        return None
+    
+    def _map_concurrent(self, func, items):
+        """Apply func to every item on a pool of worker threads, preserving order"""
+        items = list(items)
+        if not items:
             return []
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_REQUESTS, len(items))) as executor:
+            return list(executor.map(func, items))
+    
+    def _fetch_pages(self, url, max_pages):
+        """Yield (page, results) for a paginated TMDB listing.
+
+        Page 1 is fetched first to learn total_pages, the remaining pages are
+        then fetched concurrently in batches. Callers stop early by breaking out.
+        """
+        separator = '&' if '?' in url else '?'
+        data = self._fetch_json(f"{url}{separator}page=1")
+        if not data:
+            return
+        yield 1, data.get('results', [])
+
+        last_page = min(data.get('total_pages', 1), max_pages)
+        page = 2
+        while page <= last_page:
+            batch = range(page, min(page + MAX_CONCURRENT_REQUESTS, last_page + 1))
+            pages_data = self._map_concurrent(lambda p: self._fetch_json(f"{url}{separator}page={p}"), batch)
+            for batch_page, data in zip(batch, pages_data):
+                if data and data.get('results'):
+                    yield batch_page, data['results']
+            page = batch.stop
     
     def _fetch_from_endpoint(self, endpoint, pages=10):
         """Fetch movies from a specific TMDB endpoint"""
-        for page in range(1, pages + 1):
-            url = f"{TMDB_BASE_URL}/{endpoint}?api_key={self.api_key}&page={page}"
+        url = f"{TMDB_BASE_URL}/{endpoint}"
+        for page, results in self._fetch_pages(url, max_pages=pages):
             try:
-                response = requests.get(url)
-                if response.status_code == 200:
-                    data = response.json()
-                    self._process_movie_results(data.get('results', []))
-                    print(f"Fetched {endpoint} page {page}/{pages}")
-                    time.sleep(0.5)  # Prevent rate limiting
-                else:
-                    print(f"Error {response.status_code} when fetching {endpoint} page {page}")
-                    time.sleep(2)
+                self._process_movie_results(results)
+                print(f"Fetched {endpoint} page {page}/{pages}")
             except Exception as e:
                 print(f"Exception while fetching {endpoint} page {page}: {e}")
-                time.sleep(2)
     
-    def _fetch_by_year(self, year, max_pages=5, strict_year=False):
+    def _fetch_by_year(self, year, max_pages=5, strict_year=False, need_full_details=True):
         """Fetch movies released in a specific year"""
-        for page in range(1, max_pages + 1):
-            # For strict year matching, use both primary_release_year and year parameters
-            if strict_year:
-                url = f"{TMDB_BASE_URL}/discover/movie?api_key={self.api_key}&primary_release_year={year}&year={year}&page={page}&sort_by=popularity.desc"
-            else:
-                url = f"{TMDB_BASE_URL}/discover/movie?api_key={self.api_key}&primary_release_year={year}&page={page}&sort_by=popularity.desc"
-            
+        # For strict year matching, use both primary_release_year and year parameters
+        if strict_year:
+            url = f"{TMDB_BASE_URL}/discover/movie?primary_release_year={year}&year={year}&sort_by=popularity.desc"
+        else:
+            url = f"{TMDB_BASE_URL}/discover/movie?primary_release_year={year}&sort_by=popularity.desc"
+        
+        for page, results in self._fetch_pages(url, max_pages=max_pages):
             try:
-                response = requests.get(url)
-                if response.status_code == 200:
-                    data = response.json()
-                    results = data.get('results', [])
-                    
-                    # Additional verification for strict year matching
-                    if strict_year:
-                        filtered_results = []
-                        for movie in results:
-                            release_date = movie.get('release_date', '')
-                            if release_date and release_date.startswith(str(year)):
-                                filtered_results.append(movie)
-                        results = filtered_results
-                    
-                    self._process_movie_results(results)
-                    print(f"Fetched year {year} page {page}/{max_pages}")
-                    time.sleep(0.5)
-                else:
-                    print(f"Error {response.status_code} when fetching year {year} page {page}")
-                    time.sleep(2)
+                # Additional verification for strict year matching
+                if strict_year:
+                    filtered_results = []
+                    for movie in results:
+                        release_date = movie.get('release_date', '')
+                        if release_date and release_date.startswith(str(year)):
+                            filtered_results.append(movie)
+                    results = filtered_results
+                
+                self._process_movie_results(results, need_full_details=need_full_details)
+                print(f"Fetched year {year} page {page}/{max_pages}")
             except Exception as e:
                 print(f"Exception while fetching year {year} page {page}: {e}")
-                time.sleep(2)
     
     def _fetch_by_genre(self, genre_id, genre_name, max_pages=5):
         """Fetch movies by genre"""
-        for page in range(1, max_pages + 1):
-            url = f"{TMDB_BASE_URL}/discover/movie?api_key={self.api_key}&with_genres={genre_id}&page={page}&sort_by=popularity.desc"
+        url = f"{TMDB_BASE_URL}/discover/movie?with_genres={genre_id}&sort_by=popularity.desc"
+        for page, results in self._fetch_pages(url, max_pages=max_pages):
             try:
-                response = requests.get(url)
-                if response.status_code == 200:
-                    data = response.json()
-                    results = data.get('results', [])
-                    
-                    # Add genre tag for easier searching
-                    for movie in results:
-                        movie['genre_tag'] = genre_name.lower()
-                        
-                    self._process_movie_results(results)
-                    print(f"Fetched genre {genre_name} page {page}/{max_pages}")
-                    time.sleep(0.5)
-                else:
-                    print(f"Error {response.status_code} when fetching genre {genre_name} page {page}")
-                    time.sleep(2)
+                # Tag the genre for easier searching
+                self._process_movie_results(results, tags=genre_name.lower())
+                print(f"Fetched genre {genre_name} page {page}/{max_pages}")
             except Exception as e:
                 print(f"Exception while fetching genre {genre_name} page {page}: {e}")
-                time.sleep(2)
     
     def _fetch_by_language(self, language_code, max_pages=10):
         """Fetch movies by original language"""
-        for page in range(1, max_pages + 1):
-            url = f"{TMDB_BASE_URL}/discover/movie?api_key={self.api_key}&with_original_language={language_code}&page={page}&sort_by=popularity.desc"
+        url = f"{TMDB_BASE_URL}/discover/movie?with_original_language={language_code}&sort_by=popularity.desc"
+        for page, results in self._fetch_pages(url, max_pages=max_pages):
             try:
-                response = requests.get(url)
-                if response.status_code == 200:
-                    data = response.json()
-                    self._process_movie_results(data.get('results', []))
-                    print(f"Fetched language {language_code} page {page}/{max_pages}")
-                    time.sleep(0.5)
-                else:
-                    print(f"Error {response.status_code} when fetching language {language_code} page {page}")
-                    time.sleep(2)
+                self._process_movie_results(results)
+                print(f"Fetched language {language_code} page {page}/{max_pages}")
             except Exception as e:
                 print(f"Exception while fetching language {language_code} page {page}: {e}")
-                time.sleep(2)
     
     def _fetch_by_company(self, company_id, max_pages=5):
         """Fetch movies by production company"""
-        for page in range(1, max_pages + 1):
-            url = f"{TMDB_BASE_URL}/discover/movie?api_key={self.api_key}&with_companies={company_id}&page={page}&sort_by=popularity.desc"
+        url = f"{TMDB_BASE_URL}/discover/movie?with_companies={company_id}&sort_by=popularity.desc"
+        for page, results in self._fetch_pages(url, max_pages=max_pages):
             try:
-                response = requests.get(url)
-                if response.status_code == 200:
-                    data = response.json()
-                    self._process_movie_results(data.get('results', []))
-                    print(f"Fetched company {company_id} page {page}/{max_pages}")
-                    time.sleep(0.5)
-                else:
-                    print(f"Error {response.status_code} when fetching company {company_id} page {page}")
-                    time.sleep(2)
+                self._process_movie_results(results)
+                print(f"Fetched company {company_id} page {page}/{max_pages}")
             except Exception as e:
                 print(f"Exception while fetching company {company_id} page {page}: {e}")
-                time.sleep(2)
-    
-    def _process_movie_results(self, results, is_bollywood=False, is_south_indian=False, language=None):
-        """Process movie results and add to dataset if not already present"""
-        count = 0
-        for movie in results:
-            movie_id = movie.get('id')
-            if movie_id and movie_id not in self.unique_movie_ids:
+    
+    def _get_person_movie_ids(self, names, include_crew=False):
+        """Look up people by name and return the unseen movie IDs from their credits, in name order"""
+        def search_person(name):
+            data = self._fetch_json(f"{TMDB_BASE_URL}/search/person?query={name.replace(' ', '+')}")
+            results = data.get('results', []) if data else []
+            return results[0].get('id') if results else None
+
+        def get_credits(person_id):
+            return self._fetch_json(f"{TMDB_BASE_URL}/person/{person_id}/movie_credits") or {}
+
+        person_ids = [person_id for person_id in self._map_concurrent(search_person, names) if person_id]
+
+        credited = []
+        for credits_data in self._map_concurrent(get_credits, person_ids):
+            credited += credits_data.get('cast', []) + (credits_data.get('crew', []) if include_crew else [])
+        return [movie['id'] for movie in self._unseen(credited)]
+    
+    def _unseen(self, results):
+        """Return the results not in the dataset yet, keeping the first of any repeated IDs"""
+        unseen = []
+        batch_ids = set()
+        known_ids = self.unique_movie_ids  # Local name for the hot membership test
+        for result in results:
+            result_id = result.get('id')
+            if result_id and result_id not in known_ids and result_id not in batch_ids:
+                batch_ids.add(result_id)
+                unseen.append(result)
+        return unseen
+    
+    def _ingest(self, parsed_movies, checkpoint=True):
+        """Add the parsed movies not in the dataset yet and return how many were added.
+
+        New movies are also appended to PROGRESS_FILE (unless checkpoint is
+        False) so an interrupted fetch can resume from them.
+        """
+        new_movies = self._unseen(parsed_movies)
+        self.movies.extend(new_movies)
+        self.unique_movie_ids.update(movie['id'] for movie in new_movies)
+        self.movies_by_id.update((movie['id'], movie) for movie in new_movies)
+        self._index_columns(new_movies)
+        if checkpoint and new_movies:
+            if self._progress_fp is None:
+                self._progress_fp = open(PROGRESS_FILE, 'ab')
+            self._progress_fp.write(b"".join(orjson.dumps(movie) + b"\n" for movie in new_movies))
+        return len(new_movies)
+    
+    def _reset_columns(self):
+        """Empty the per-movie filter columns.
+
+        movie_languages, movie_content_types and movie_years are public, since the
+        /api/filters and /api/stats aggregations read them too.
+        """
+        self.movie_languages = np.array([], dtype='U2')
+        self.movie_content_types = np.array([], dtype='U5')
+        self.movie_years = np.array([], dtype=np.int16)  # 0 when the release date is missing
+        self._by_genre = defaultdict(list)  # Lowercased genre name -> indices of the movies with it
+    
+    def _index_columns(self, movies):
+        """Append the filter fields of each movie to the per-movie columns"""
+        start = len(self.movie_years)
+        # Only a handful of distinct codes exist, so share one string object per value
+        # instead of keeping a separate copy in every loaded movie
+        for movie in movies:
+            for field in ('language', 'content_type'):
+                if isinstance(movie.get(field), str):
+                    movie[field] = sys.intern(movie[field])
+        self.movie_languages = np.concatenate([self.movie_languages, np.array([movie.get('language', '') for movie in movies], dtype='U2')])
+        self.movie_content_types = np.concatenate([self.movie_content_types, np.array([movie.get('content_type', '') for movie in movies], dtype='U5')])
+        self.movie_years = np.concatenate([self.movie_years, np.array([self._release_year(movie) for movie in movies], dtype=np.int16)])
+        for idx, movie in enumerate(movies, start):
+            for genre in {genre.lower() for genre in movie.get('genres', [])}:
+                self._by_genre[genre].append(idx)
+    
+    @staticmethod
+    def _release_year(movie):
+        """Year of a movie's release (or a show's first air date), 0 if unknown"""
+        year = (movie.get('release_date') or movie.get('first_air_date') or '')[:4]
+        # A digit check is far cheaper than raising ValueError for the empty dates TMDB often sends
+        return int(year) if year.isdecimal() else 0
+    
+    def _process_movie_results(self, results, is_bollywood=False, is_south_indian=False, language=None, need_full_details=True, tags=None):
+        """Process movie results, add the new ones to the dataset and return how many were added.
+
+        With need_full_details=False the records are built from the listing
+        fields alone (no director, cast or keywords), saving a detail request per movie.
+        tags are extra search terms appended to each new movie's document. They are
+        passed in rather than written into the results, which may be shared with
+        the TMDB response cache.
+        """
+        parsed_movies = []
+        new_movies = self._unseen(results)
+
+        if need_full_details:
+            # Get additional movie details for the whole batch concurrently
+            all_details = self._map_concurrent(lambda movie: self._get_movie_details(movie['id']), new_movies)
+        else:
+            genre_names = self._get_genre_names()
+            all_details = [self._movie_from_listing(movie, genre_names) for movie in new_movies]
+
+        for movie, movie_details in zip(new_movies, all_details):
+            movie_id = movie['id']
+            if movie_details:
                 try:
-                    # Get additional movie details
-                    movie_details = self._get_movie_details(movie_id)
-                    
-                    if movie_details:
-                        # Add specific tags based on movie type
-                        if is_bollywood:
-                            movie_details['document'] += " bollywood hindi indian"
-                        elif is_south_indian:
-                            movie_details['document'] += f" {language.lower()} south indian"
-                        
-                        # Add any genre or language tags that were added during fetching
-                        if 'genre_tag' in movie:
-                            movie_details['document'] += f" {movie['genre_tag']}"
-                        if 'language_tag' in movie:
-                            movie_details['document'] += f" {movie['language_tag']}"
-                        
-                        self.movies.append(movie_details)
-                        self.unique_movie_ids.add(movie_id)
-                        count += 1
+                    # Add specific tags based on movie type
+                    if is_bollywood:
+                        movie_details['document'] += " bollywood hindi indian"
+                    elif is_south_indian:
+                        movie_details['document'] += f" {language.lower()} south indian"
+
+                    # Add any genre or language tags from the fetch
+                    if tags:
+                        movie_details['document'] += f" {tags}"
+
+                    parsed_movies.append(movie_details)
                 except Exception as e:
                     print(f"Error processing movie {movie_id}: {e}")
-        
+
+        count = self._ingest(parsed_movies)
         print(f"Added {count} new movies from batch")
+        return count
+    
+    def _process_tv_results(self, results, tags):
+        """Process TV show results, adding the given search tags to each new show, and return how many were added"""
+        parsed_shows = []
+        new_shows = self._unseen(results)
+
+        all_details = self._map_concurrent(lambda show: self._get_tv_details(show['id']), new_shows)
+
+        for show_details in all_details:
+            if show_details:
+                show_details['document'] += f" {tags}"
+                parsed_shows.append(show_details)
+
+        count = self._ingest(parsed_shows)
+        print(f"Added {count} new TV shows from batch")
+        return count
     
     def _get_movie_details(self, movie_id, prefer_hindi=False):
         """Get detailed information about a specific movie"""
-        url = f"{TMDB_BASE_URL}/movie/{movie_id}?api_key={self.api_key}&append_to_response=credits,keywords"
+        url = f"{TMDB_BASE_URL}/movie/{movie_id}?append_to_response=credits,keywords"
         try:
-            response = requests.get(url)
-            if response.status_code == 200:
-                data = response.json()
-                
-                # Basic movie information
-                title = data.get('title', '')
-                original_title = data.get('original_title', '')
-                overview = data.get('overview', '')
-                release_date = data.get('release_date', '')
+            data = self._fetch_json(url)
+            if data:
                 
                 # Language handling - for Bollywood preferences
-                original_language = data.get('original_language', '')
-                if prefer_hindi and original_language != 'hi':
+                if prefer_hindi and data.get('original_language', '') != 'hi':
                     return None
                 
                 # Get genres, cast, crew
@@ -838,7 +965,6 @@ class MovieRecommender:
                 
                 # Get director and top cast
                 director = ""
-                cast = []
                 
                 credits = data.get('credits', {})
                 crew = credits.get('crew', [])
@@ -849,69 +975,79 @@ class MovieRecommender:
                         director = person.get('name', '')
                         break
                 
-                for actor in actors[:10]:  # Get top 10 cast
-                    if actor.get('name'):
-                        cast.append(actor.get('name'))
+                # Get top 10 cast, reading each name once
+                cast = [name for name in (actor.get('name') for actor in actors[:10]) if name]
                 
                 # Get keywords/tags
                 keywords = []
                 if 'keywords' in data and 'keywords' in data['keywords']:
                     keywords = [kw['name'] for kw in data['keywords']['keywords']]
                 
-                # Create a comprehensive document for text search
-                document = f"{title} {original_title} {overview} "
-                document += f"{' '.join(genres)} {director} {' '.join(cast)} {' '.join(keywords)} "
-                document += f"{release_date[:4] if release_date else ''} "  # Add year for searching by year
-                
-                # Add movie or specific category identifiers
-                document += "movie film "
-                
-                # Add language specific identifiers
-                if original_language == 'en':
-                    document += "english hollywood international "
-                elif original_language == 'hi':
-                    document += "hindi bollywood indian "
-                elif original_language == 'ta':
-                    document += "tamil south indian "
-                elif original_language == 'te':
-                    document += "telugu south indian "
-                elif original_language == 'ml':
-                    document += "malayalam south indian "
-                elif original_language == 'kn':
-                    document += "kannada south indian "
-                
-                # Store the movie data
-                movie_data = {
-                    'id': movie_id,
-                    'title': title,
-                    'original_title': original_title,
-                    'overview': overview,
-                    'poster_path': data.get('poster_path', ''),
-                    'release_date': release_date,
-                    'genres': genres,
-                    'director': director,
-                    'cast': cast,
-                    'language': original_language,
-                    'document': document,
-                    'content_type': 'movie',
-                    'keywords': keywords
-                }
-                
-                return movie_data
+                return self._movie_record(movie_id, data, genres, director, cast, keywords)
             else:
-                print(f"Error {response.status_code} when fetching movie {movie_id}")
                 return None
         except Exception as e:
             print(f"Exception while fetching movie {movie_id}: {e}")
             return None
     
+    def _movie_from_listing(self, result, genre_names):
+        """Build a movie record from a discover/list result, without a detail request"""
+        genres = [genre_names[genre_id] for genre_id in result.get('genre_ids', []) if genre_id in genre_names]
+        return self._movie_record(result['id'], result, genres)
+    
+    def _get_genre_names(self):
+        """Map TMDB movie genre IDs to names, fetching the genre list once"""
+        if self._genre_names is None:
+            self._genre_names = {genre['id']: genre['name'] for genre in self._get_genres()}
+        return self._genre_names
+    
+    def _movie_record(self, movie_id, data, genres, director="", cast=None, keywords=None):
+        """Build the stored movie record, with its search document, from TMDB movie fields"""
+        cast = cast or []
+        keywords = keywords or []
+        title = data.get('title', '')
+        original_title = data.get('original_title', '')
+        overview = data.get('overview', '')
+        release_date = data.get('release_date', '')
+        original_language = data.get('original_language', '')
+        
+        # Create a comprehensive document for text search
+        parts = [title, original_title, overview, ' '.join(genres), director, ' '.join(cast), ' '.join(keywords)]
+        parts.append(release_date[:4] if release_date else '')  # Add year for searching by year
+
+        # Add movie or specific category identifiers
+        parts.append("movie film")
+
+        # Add language specific identifiers
+        parts.append(LANG_TAGS.get(original_language, ''))
+
+        document = ' '.join(part for part in parts if part)
+
+        # Store the movie data
+        movie_data = {
+            'id': movie_id,
+            'title': title,
+            'original_title': original_title,
+            'overview': overview,
+            'poster_path': data.get('poster_path', ''),
+            'release_date': release_date,
+            'genres': genres,
+            'director': director,
+            'cast': cast,
+            'language': original_language,
+            'document': document,
+            'content_type': 'movie',
+            'keywords': keywords
+        }
+
+        return movie_data
+    
     def _get_tv_details(self, show_id):
         """Get detailed information about a TV show"""
-        url = f"{TMDB_BASE_URL}/tv/{show_id}?api_key={self.api_key}&append_to_response=credits,keywords"
+        url = f"{TMDB_BASE_URL}/tv/{show_id}?append_to_response=credits,keywords"
         try:
-            response = requests.get(url)
-            if response.status_code == 200:
-                data = response.json()
+            data = self._fetch_json(url)
+            if data:
                 
                 # Basic show information
                 title = data.get('name', '')
@@ -923,20 +1059,14 @@ class MovieRecommender:
                 genres = [genre['name'] for genre in data.get('genres', [])]
                 
                 # Get creator and top cast
-                creators = []
-                cast = []
-                
                 creator_data = data.get('created_by', [])
-                for creator in creator_data:
-                    if creator.get('name'):
-                        creators.append(creator.get('name'))
+                creators = [name for name in (creator.get('name') for creator in creator_data) if name]
                 
                 credits = data.get('credits', {})
                 actors = credits.get('cast', [])
                 
-                for actor in actors[:10]:  # Get top 10 cast
-                    if actor.get('name'):
-                        cast.append(actor.get('name'))
+                # Get top 10 cast, reading each name once
+                cast = [name for name in (actor.get('name') for actor in actors[:10]) if name]
                 
                 # Get keywords/tags
                 keywords = []
@@ -944,27 +1074,15 @@ class MovieRecommender:
                     keywords = [kw['name'] for kw in data['keywords']['results']]
                 
                 # Create a comprehensive document for text search
-                document = f"{title} {original_title} {overview} "
-                document += f"{' '.join(genres)} {' '.join(creators)} {' '.join(cast)} {' '.join(keywords)} "
-                document += f"{first_air_date[:4] if first_air_date else ''} "  # Add year
+                parts = [title, original_title, overview, ' '.join(genres), ' '.join(creators), ' '.join(cast), ' '.join(keywords)]
+                parts.append(first_air_date[:4] if first_air_date else '')  # Add year
                 
                 # Add TV identifiers
-                document += "tv television series show web series streaming "
+                parts.append("tv television series show web series streaming")
                 
                 # Add language specific identifiers
                 original_language = data.get('original_language', '')
-                if original_language == 'en':
-                    document += "english hollywood international "
-                elif original_language == 'hi':
-                    document += "hindi bollywood indian "
-                elif original_language == 'ta':
-                    document += "tamil south indian "
-                elif original_language == 'te':
-                    document += "telugu south indian "
-                elif original_language == 'ml':
-                    document += "malayalam south indian "
-                elif original_language == 'kn':
-                    document += "kannada south indian "
+                parts.append(LANG_TAGS.get(original_language, ''))
                 
                 # Add streaming platform information if available
                 networks = data.get('networks', [])
@@ -972,25 +1090,15 @@ class MovieRecommender:
                 for network in networks:
                     name = network.get('name', '').lower()
                     network_names.append(name)
-                    document += f"{name} "
+                    parts.append(name)
                     
                     # Add common OTT platform keywords
-                    if 'netflix' in name:
-                        document += "netflix ott streaming "
-                    elif 'amazon' in name or 'prime' in name:
-                        document += "amazon prime video ott streaming "
-                    elif 'disney' in name or 'hotstar' in name:
-                        document += "disney+ hotstar ott streaming "
-                    elif 'hbo' in name:
-                        document += "hbo max ott streaming "
-                    elif 'hulu' in name:
-                        document += "hulu ott streaming "
-                    elif 'zee' in name:
-                        document += "zee5 ott streaming "
-                    elif 'sony' in name:
-                        document += "sonyliv ott streaming "
-                    elif 'alt' in name or 'balaji' in name:
-                        document += "altbalaji ott streaming "
+                    for key, tag in PLATFORM_TAGS.items():
+                        if key in name:
+                            parts.append(tag)
+                            break
+                
+                document = ' '.join(part for part in parts if part)
                 
                 # Store the TV show data
                 show_data = {
@@ -1012,7 +1120,6 @@ class MovieRecommender:
                 
                 return show_data
             else:
-                print(f"Error {response.status_code} when fetching TV show {show_id}")
                 return None
         except Exception as e:
             print(f"Exception while fetching TV show {show_id}: {e}")
@@ -1021,346 +1128,405 @@ class MovieRecommender:
     def _save_progress(self, stage_name):
         """Save progress after completing a stage of data fetching"""
         print(f"Progress update: {stage_name} - Total movies/shows: {len(self.movies)}")
-        with open(DATA_FILE, 'w', encoding='utf-8') as f:
-            json.dump(self.movies, f, ensure_ascii=False)
+        # New movies were already appended as they were ingested; make them durable
+        if self._progress_fp is not None:
+            self._progress_fp.flush()
+            os.fsync(self._progress_fp.fileno())
+    
+    def _save_data(self):
+        """Write the consolidated dataset and drop the checkpoints it now contains"""
+        with open(DATA_FILE, 'wb') as f:
+            f.write(orjson.dumps(self.movies))  # Compact; the file is only read back by _load_data
+        if self._progress_fp is not None:
+            self._progress_fp.close()
+            self._progress_fp = None
+        if os.path.exists(PROGRESS_FILE):
+            os.remove(PROGRESS_FILE)
     
     def _prepare_tfidf(self):
-        """Prepare TF-IDF matrix for movie recommendations"""
-        print("Preparing TF-IDF matrix for recommendations...")
-        
-        # Extract document text
-        documents = [self._preprocess_text(movie['document']) for movie in self.movies]
+        """Prepare TF-IDF matrix for movie recommendations, reusing the saved one if it is current"""
+        if self._load_tfidf():
+            print(f"Loaded TF-IDF matrix from {TFIDF_MATRIX_FILE}")
+        else:
+            self._build_tfidf()
+            save_npz(TFIDF_MATRIX_FILE, self.tfidf_matrix, compressed=False)
+            joblib.dump(self.vectorizer, VECTORIZER_FILE, compress=0)
         
-        # Create TF-IDF matrix
-        self.vectorizer = TfidfVectorizer(max_features=5000)
-        self.tfidf_matrix = self.vectorizer.fit_transform(documents)
+        # Term-major copy so a query only touches the postings of its own terms
+        self.term_matrix = self.tfidf_matrix.T.tocsr()
         
         print(f"TF-IDF matrix shape: {self.tfidf_matrix.shape}")
     
-    def _preprocess_text(self, text):
-        """Preprocess text for better NLP performance"""
-        if not text:
-            return ""
-            
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Remove special characters and digits
-        text = re.sub(r'[^\w\s]', ' ', text)
-        text = re.sub(r'\d+', ' ', text)
-        
-        # Tokenize and remove stop words
-        stop_words = set(stopwords.words('english'))
-        tokens = word_tokenize(text)
-        tokens = [token for token in tokens if token not in stop_words]
+    def _load_tfidf(self):
+        """Load the saved TF-IDF matrix and vectorizer if they were built from the current DATA_FILE"""
+        try:
+            data_mtime = os.path.getmtime(DATA_FILE)
+            if min(os.path.getmtime(TFIDF_MATRIX_FILE), os.path.getmtime(VECTORIZER_FILE)) < data_mtime:
+                return False
+            tfidf_matrix = load_npz(TFIDF_MATRIX_FILE)
+            vectorizer = joblib.load(VECTORIZER_FILE)
+        except Exception:
+            return False  # Missing or unreadable; rebuild
+        if tfidf_matrix.shape != (len(self.movies), HASHING_FEATURES):
+            return False
+        self.tfidf_matrix = tfidf_matrix
+        self.vectorizer = vectorizer
+        return True
+    
+    def _build_tfidf(self):
+        """Fit the TF-IDF vectorizer on the movie documents"""
+        print("Preparing TF-IDF matrix for recommendations...")
         
-        # Lemmatize
-        lemmatizer = WordNetLemmatizer()
-        tokens = [lemmatizer.lemmatize(token) for token in tokens]
+        # Extract and preprocess document text. This stays in-process: a worker pool
+        # started while the module is being imported deadlocks on the import lock,
+        # and with memoized lemmas a full rebuild only takes about a second
+        documents = [_preprocess_text(movie['document']) for movie in self.movies]
         
-        return ' '.join(tokens)
+        # Create TF-IDF matrix; hashing terms avoids building and storing a vocabulary.
+        # Rows (and query vectors) come out L2-normalized, so cosine similarity is a plain dot product.
+        # float32 halves the matrix size; scores don't need double precision
+        self.vectorizer = Pipeline([
+            ('hashing', HashingVectorizer(n_features=HASHING_FEATURES, alternate_sign=False, norm=None, dtype=np.float32)),
+            ('tfidf', TfidfTransformer(norm='l2'))
+        ])
+        self.tfidf_matrix = self.vectorizer.fit_transform(documents)
     
     def recommend_movies(self, query, n=10, filters=None):
         """Recommend movies based on query and optional filters"""
         # Preprocess query
-        processed_query = self._preprocess_text(query)
+        processed_query = _preprocess_text(query)
         
         # Convert query to TF-IDF vector
         query_vec = self.vectorizer.transform([processed_query])
         
         # Calculate similarity scores
-        cosine_similarities = cosine_similarity(query_vec, self.tfidf_matrix).flatten()
+        # Cosine similarity as one sparse product over the query terms' postings
+        cosine_similarities = (query_vec @ self.term_matrix).toarray().ravel()
+        
+        return self._rank_movies(cosine_similarities, n, filters)
+    
+    def recommend_movies_batch(self, queries, n=10, filters_list=None):
+        """Recommend movies for several queries at once, with optional filters per query.
+
+        All queries are vectorized together and scored in a single sparse product,
+        so the movie matrix is traversed once for the whole batch.
+        """
+        query_vecs = self.vectorizer.transform([_preprocess_text(query) for query in queries])
+        similarities = (query_vecs @ self.term_matrix).toarray()
         
+        if filters_list is None:
+            filters_list = [None] * len(queries)
+        return [self._rank_movies(row, n, filters) for row, filters in zip(similarities, filters_list)]
+    
+    def _rank_movies(self, cosine_similarities, n, filters):
+        """Turn one query's similarity scores into its top N recommendations"""
         # Apply filters if specified
         if filters:
-            filtered_indices = self._apply_filters(filters)
+            mask = self._apply_filters(filters)
             
-            # If we have valid filtered indices
-            if filtered_indices:
-                # Zero out similarity scores for non-matching indices
-                mask = np.ones(len(cosine_similarities), dtype=bool)
-                mask[filtered_indices] = False
-                cosine_similarities[mask] = 0
+            # If any movie matches, zero out similarity scores for the rest
+            if mask.any():
+                cosine_similarities[~mask] = 0
         
-        # Get top N similar movies
-        top_indices = cosine_similarities.argsort()[-n:][::-1]
+        # Get top N similar movies; partition out the N best, then sort only those
+        if n < len(cosine_similarities):
+            top_indices = np.argpartition(-cosine_similarities, n)[:n]
+        else:
+            top_indices = np.arange(len(cosine_similarities))
+        top_indices = top_indices[np.argsort(-cosine_similarities[top_indices])]
         
-        # Create recommendations list
+        # Create recommendations list; scores and indices come out as plain Python
+        # numbers in one go rather than one NumPy scalar lookup per field
+        movies = self.movies
         recommendations = []
-        for idx in top_indices:
-            if cosine_similarities[idx] > 0:  # Only include movies with non-zero similarity
-                movie = self.movies[idx]
+        for idx, score in zip(top_indices.tolist(), cosine_similarities[top_indices].tolist()):
+            if score > 0:  # Only include movies with non-zero similarity
+                movie = movies[idx]
                 recommendations.append({
                     'id': movie['id'],
                     'title': movie['title'],
                     'overview': movie['overview'],
                     'poster_path': movie['poster_path'],
-                    'release_date': movie.get('release_date', movie.get('first_air_date', '')),
-                    'similarity_score': float(cosine_similarities[idx]),
+                    'release_date': movie['release_date'] if 'release_date' in movie else movie.get('first_air_date', ''),
+                    'similarity_score': score,
                     'content_type': movie.get('content_type', 'movie')
                 })
         
         return recommendations
     
     def _apply_filters(self, filters):
-        """Apply filters to narrow down movie recommendations"""
-        filtered_indices = []
+        """Return a boolean mask of the movies matching the filters"""
+        mask = np.ones(len(self.movies), dtype=bool)
         
-        for i, movie in enumerate(self.movies):
-            include = True
-            
-            # Year filter
-            if 'year' in filters:
-                year_str = ''
-                if movie.get('release_date'):
-                    year_str = movie['release_date'][:4]
-                elif movie.get('first_air_date'):
-                    year_str = movie['first_air_date'][:4]
-                
-                if year_str != str(filters['year']):
-                    include = False
-            
-            # Genre filter
-            if 'genre' in filters and include:
-                if not any(genre.lower() == filters['genre'].lower() for genre in movie.get('genres', [])):
-                    include = False
-            
-            # Language filter
-            if 'language' in filters and include:
-                if movie.get('language') != filters['language']:
-                    include = False
-            
-            # Content type filter
-            if 'content_type' in filters and include:
-                if movie.get('content_type') != filters['content_type']:
-                    include = False
-            
-            # Time period filter
-            if 'time_period' in filters and include:
-                start_year, end_year = filters['time_period']
-                year = 0
-                if movie.get('release_date'):
-                    try:
-                        year = int(movie['release_date'][:4])
-                    except ValueError:
-                        pass
-                elif movie.get('first_air_date'):
-                    try:
-                        year = int(movie['first_air_date'][:4])
-                    except ValueError:
-                        pass
-                
-                if not (start_year <= year <= end_year):
-                    include = False
-            
-            # Add more filters as needed
-            
-            if include:
-                filtered_indices.append(i)
+        # Year filter
+        if 'year' in filters:
+            try:
+                mask &= self.movie_years == int(filters['year'])
+            except (TypeError, ValueError, OverflowError):
+                mask[:] = False
+        
+        # Genre filter, from the genre's inverted list rather than a scan over every movie
+        if 'genre' in filters:
+            genre_mask = np.zeros(len(self.movies), dtype=bool)
+            if isinstance(filters['genre'], str):
+                genre_mask[self._by_genre.get(filters['genre'].lower(), [])] = True
+            mask &= genre_mask
+        
+        # Language filter; regions like "south indian" map to a list of languages
+        if 'language' in filters:
+            language = filters['language']
+            if isinstance(language, (list, tuple)):
+                mask &= np.isin(self.movie_languages, language)
+            else:
+                mask &= self.movie_languages == language
         
-        return filtered_indices
+        # Content type filter
+        if 'content_type' in filters:
+            content_type = filters['content_type']
+            if isinstance(content_type, (list, tuple)):
+                mask &= np.isin(self.movie_content_types, content_type)
+            else:
+                mask &= self.movie_content_types == content_type
+        
+        # Time period filter
+        if 'time_period' in filters:
+            start_year, end_year = filters['time_period']
+            mask &= (self.movie_years >= start_year) & (self.movie_years <= end_year)
+        
+        # Add more filters as needed
+        
+        return mask
     
     def extract_keywords_from_query(self, query):
         """Extract keywords from query for better understanding user intent"""
-        # Common keywords to look for
-        year_pattern = r'\b(19\d{2}|20\d{2})\b'
-        genre_keywords = ["action", "comedy", "drama", "horror", "sci-fi", "romance", "thriller", 
-                         "adventure", "fantasy", "animation", "documentary", "biography"]
-        region_keywords = {
-            "hollywood": "en",
-            "bollywood": "hi",
-            "hindi": "hi",
-            "tamil": "ta",
-            "telugu": "te",
-            "malayalam": "ml", 
-            "kannada": "kn",
-            "south indian": ["ta", "te", "ml", "kn"],
-            "indian": ["hi", "ta", "te", "ml", "kn"]
-        }
-        content_type_keywords = {
-            "movie": "movie",
-            "film": "movie",
-            "web series": "tv",
-            "tv series": "tv",
-            "show": "tv",
-            "television": "tv",
-            "ott": "tv",
-            "streaming": "tv"
-        }
-        
         # Extract filters
         filters = {}
+        query_lower = query.lower()
         
         # Extract year
-        year_match = re.search(year_pattern, query)
+        year_match = YEAR_RE.search(query)
         if year_match:
             filters['year'] = int(year_match.group())
         
         # Extract genre
-        for genre in genre_keywords:
-            if re.search(r'\b' + genre + r'\b', query.lower()):
-                filters['genre'] = genre
-                break
+        genre = _first_keyword(GENRE_RE, GENRE_KEYWORDS, query_lower)
+        if genre:
+            filters['genre'] = genre
         
         # Extract region/language
-        for region, language in region_keywords.items():
-            if re.search(r'\b' + region + r'\b', query.lower()):
-                filters['language'] = language
-                break
+        region = _first_keyword(REGION_RE, REGION_KEYWORDS, query_lower)
+        if region:
+            filters['language'] = REGION_KEYWORDS[region]
         
         # Extract content type
-        for content_type, value in content_type_keywords.items():
-            if re.search(r'\b' + content_type + r'\b', query.lower()):
-                filters['content_type'] = value
-                break
+        content_type = _first_keyword(CONTENT_TYPE_RE, CONTENT_TYPE_KEYWORDS, query_lower)
+        if content_type:
+            filters['content_type'] = CONTENT_TYPE_KEYWORDS[content_type]
         
         # Extract feeling/mood
-        feeling_mapping = {
-            # Map feelings to genres/keywords
-            "happy": ["comedy", "feel-good", "uplifting"],
-            "sad": ["drama", "tragedy", "emotional"],
-            "scary": ["horror", "thriller", "suspense"],
-            "exciting": ["action", "adventure", "thriller"],
-            "thoughtful": ["drama", "philosophical", "thought-provoking"],
-            "romantic": ["romance", "love story", "romantic comedy"]
-        }
-        
-        for feeling, keywords in feeling_mapping.items():
-            if re.search(r'\b' + feeling + r'\b', query.lower()):
-                # Add these keywords to the query itself rather than as filters
-                query += ' ' + ' '.join(keywords)
-                break
+        feeling = _first_keyword(FEELING_RE, FEELING_KEYWORDS, query_lower)
+        if feeling:
+            # Add these keywords to the query itself rather than as filters
+            query += ' ' + ' '.join(FEELING_KEYWORDS[feeling])
         
         return query, filters
 
+def _json_response(obj, status=200):
+    """Serialize a response body with orjson, which is much faster than jsonify for movie dicts"""
+    return app.response_class(orjson.dumps(obj), status=status, mimetype='application/json')
+
+@app.errorhandler(orjson.JSONEncodeError)
+def unencodable_request(error):
+    # Responses echo the request's filter values, and orjson rejects some values
+    # jsonify accepted, such as integers beyond 64 bits
+    return _json_response({'error': f'Request contains a value that cannot be returned as JSON: {error}'}, 400)
+
 # Create API endpoints
 @app.route('/api/recommend', methods=['POST'])
 def recommend():
     data = request.get_json()
     query = data.get('query', '')
-    n = int(data.get('n', 10))
+    n = _requested_count(data)
     
     if not query:
-        return jsonify({'error': 'No query provided'}), 400
+        return _json_response({'error': 'No query provided'}, 400)
+    
+    # Filters explicitly provided, in a fixed order so they can be part of the cache key
+    overrides = tuple((key, data[key]) for key in FILTER_KEYS if key in data)
+    
+    # Only small responses are cached, and unhashable override values (e.g. lists) can't be cache keys
+    if n <= RECOMMEND_CACHE_MAX_N and _is_hashable((query, overrides)):
+        body = _recommend_body(query, n, overrides)
+    else:
+        body = _recommend_body.__wrapped__(query, n, overrides)
     
+    return app.response_class(body, mimetype='application/json')
+
+def _requested_count(data):
+    """Number of recommendations asked for, clamped to between 0 and the dataset size"""
+    return max(0, min(int(data.get('n', 10)), len(recommender.movies)))
+
+def _is_hashable(value):
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+@lru_cache(maxsize=RECOMMEND_CACHE_SIZE)
+def _recommend_body(query, n, overrides):
+    """Serialized /api/recommend response; the dataset doesn't change while serving,
+    so repeated queries are answered from the cache"""
     # Extract keywords from query
     enhanced_query, filters = recommender.extract_keywords_from_query(query)
     
     # Override filters if explicitly provided
-    for filter_key in ['year', 'genre', 'language', 'content_type']:
-        if filter_key in data:
-            filters[filter_key] = data[filter_key]
+    filters.update(overrides)
     
     # Get recommendations
     recommendations = recommender.recommend_movies(enhanced_query, n, filters)
     
-    return jsonify({
+    return orjson.dumps(_recommend_result(query, enhanced_query, filters, recommendations))
+
+def _recommend_result(query, enhanced_query, filters, recommendations):
+    """One query's result, as returned by /api/recommend and per query by /api/recommend_batch"""
+    return {
         'original_query': query,
         'enhanced_query': enhanced_query,
         'filters_applied': filters,
         'recommendations': recommendations
+    }
+
+@app.route('/api/recommend_batch', methods=['POST'])
+def recommend_batch():
+    data = request.get_json()
+    queries = data.get('queries')
+    n = _requested_count(data)
+    
+    if not isinstance(queries, list) or not queries or not all(isinstance(query, str) and query for query in queries):
+        return _json_response({'error': 'No queries provided'}, 400)
+    if len(queries) > MAX_BATCH_QUERIES:
+        return _json_response({'error': f'At most {MAX_BATCH_QUERIES} queries per batch'}, 400)
+    
+    # Extract keywords from each query; explicit filters apply to the whole batch
+    extracted = [recommender.extract_keywords_from_query(query) for query in queries]
+    overrides = {key: data[key] for key in FILTER_KEYS if key in data}
+    for _, filters in extracted:
+        filters.update(overrides)
+    
+    # Score every query in one pass
+    batch_recommendations = recommender.recommend_movies_batch(
+        [enhanced_query for enhanced_query, _ in extracted], n, [filters for _, filters in extracted])
+    
+    return _json_response({
+        'results': [_recommend_result(query, enhanced_query, filters, recommendations)
+                    for query, (enhanced_query, filters), recommendations in zip(queries, extracted, batch_recommendations)]
     })
 
 @app.route('/api/movie/<int:movie_id>', methods=['GET'])
 def get_movie(movie_id):
-    for movie in recommender.movies:
-        if movie['id'] == movie_id:
-            return jsonify(movie)
+    movie = recommender.movies_by_id.get(movie_id)
+    if movie:
+        return _json_response(movie)
     
-    return jsonify({'error': 'Movie not found'}), 404
+    return _json_response({'error': 'Movie not found'}, 404)
 
 @app.route('/api/filters', methods=['GET'])
 def get_filters():
+    return _cached_response(_filters_cache)
+
+@app.route('/api/stats', methods=['GET'])
+def get_stats():
+    return _cached_response(_stats_cache)
+
+# The dataset doesn't change while serving, so /api/filters and /api/stats are
+# computed and serialized once at startup
+_filters_cache = None
+_stats_cache = None
+CACHE_CONTROL = 'public, max-age=3600'
+
+def _build_caches():
+    """Serialize the /api/filters and /api/stats responses for the loaded dataset"""
+    global _filters_cache, _stats_cache
+    _filters_cache = _cache_entry(orjson.dumps(_compute_filters()))
+    # year_distribution is keyed by int year
+    _stats_cache = _cache_entry(orjson.dumps(_compute_stats(), option=orjson.OPT_NON_STR_KEYS))
+
+def _cache_entry(body):
+    """A cached body with its gzip-compressed form and ETag"""
+    return {
+        'body': body,
+        'gzip': gzip.compress(body, compresslevel=6, mtime=0),
+        'etag': hashlib.sha1(body).hexdigest()
+    }
+
+def _cached_response(entry):
+    """Serve a body serialized at startup, or 304 if the client already has it.
+
+    Clients that accept gzip get the body compressed at startup, under its own ETag.
+    """
+    use_gzip = request.accept_encodings['gzip'] > 0
+    etag = entry['etag'] + '-gzip' if use_gzip else entry['etag']
+    if etag in request.if_none_match:
+        response = app.response_class(status=304)
+    elif use_gzip:
+        response = app.response_class(entry['gzip'], mimetype='application/json')
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = app.response_class(entry['body'], mimetype='application/json')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = CACHE_CONTROL
+    response.headers['Vary'] = 'Accept-Encoding'
+    return response
+
+def _compute_filters():
     # Extract unique values for filters
-    languages = set()
-    genres = set()
-    years = set()
-    content_types = set()
+    movies = recommender.movies
+    languages = {movie['language'] for movie in movies if 'language' in movie}
+    genres = set(chain.from_iterable(movie.get('genres', ()) for movie in movies))
+    content_types = {movie['content_type'] for movie in movies if 'content_type' in movie}
     
-    for movie in recommender.movies:
-        if 'language' in movie:
-            languages.add(movie['language'])
-        
-        for genre in movie.get('genres', []):
-            genres.add(genre)
-        
-        # Extract year from release date or first air date
-        year = None
-        if 'release_date' in movie and movie['release_date']:
-            try:
-                year = int(movie['release_date'][:4])
-            except ValueError:
-                pass
-        elif 'first_air_date' in movie and movie['first_air_date']:
-            try:
-                year = int(movie['first_air_date'][:4])
-            except ValueError:
-                pass
-                
-        if year:
-            years.add(year)
-            
-        if 'content_type' in movie:
-            content_types.add(movie['content_type'])
+    # Years were parsed from the release or first air date when the movies were loaded
+    years = set(recommender.movie_years[recommender.movie_years > 0].tolist())
     
     # Map language codes to names
-    language_names = {
-        'en': 'English',
-        'hi': 'Hindi',
-        'ta': 'Tamil',
-        'te': 'Telugu',
-        'ml': 'Malayalam',
-        'kn': 'Kannada'
-    }
-    
-    languages_with_names = [{'code': code, 'name': language_names.get(code, code)} for code in languages]
+    languages_with_names = [{'code': code, 'name': LANGUAGE_NAMES.get(code, code)} for code in languages]
     
-    return jsonify({
-        'languages': sorted(languages_with_names, key=lambda x: x['name']),
-        'genres': sorted(list(genres)),
-        'years': sorted(list(years)),
-        'content_types': sorted(list(content_types))
-    })
+    # Sorted once here and frozen, since the dataset doesn't change while serving
+    return {
+        'languages': tuple(sorted(languages_with_names, key=lambda x: x['name'])),
+        'genres': tuple(sorted(genres)),
+        'years': tuple(sorted(years)),
+        'content_types': tuple(sorted(content_types))
+    }
 
-@app.route('/api/stats', methods=['GET'])
-def get_stats():
-    # Calculate statistics about the dataset
+def _compute_stats():
+    # Calculate statistics about the dataset from the recommender's per-movie columns
     total_count = len(recommender.movies)
+    content_types = recommender.movie_content_types
+    languages = recommender.movie_languages
+    years = recommender.movie_years
     
     # Count by content type
-    movies_count = sum(1 for movie in recommender.movies if movie.get('content_type') == 'movie')
-    tv_count = sum(1 for movie in recommender.movies if movie.get('content_type') == 'tv')
+    is_movie = content_types == 'movie'
+    movies_count = int(np.count_nonzero(is_movie))
+    tv_count = int(np.count_nonzero(content_types == 'tv'))
     
     # Count by language/region
-    hollywood_count = sum(1 for movie in recommender.movies if movie.get('content_type') == 'movie' and movie.get('language') == 'en')
-    bollywood_count = sum(1 for movie in recommender.movies if movie.get('language') == 'hi')
-    south_indian_count = sum(1 for movie in recommender.movies if movie.get('language') in ['ta', 'te', 'ml', 'kn'])
+    hollywood_count = int(np.count_nonzero(is_movie & (languages == 'en')))
+    bollywood_count = int(np.count_nonzero(languages == 'hi'))
+    south_indian_count = int(np.count_nonzero(np.isin(languages, SOUTH_INDIAN_LANGUAGES)))
     
     # Genre distribution
-    genre_counts = {}
+    genre_counts = Counter()
     for movie in recommender.movies:
-        for genre in movie.get('genres', []):
-            genre_counts[genre] = genre_counts.get(genre, 0) + 1
+        genre_counts.update(movie.get('genres', ()))
     
-    # Year distribution
-    year_counts = {}
-    for movie in recommender.movies:
-        year = None
-        if movie.get('release_date'):
-            try:
-                year = int(movie['release_date'][:4])
-            except ValueError:
-                pass
-        elif movie.get('first_air_date'):
-            try:
-                year = int(movie['first_air_date'][:4])
-            except ValueError:
-                pass
-        
-        if year:
-            year_counts[year] = year_counts.get(year, 0) + 1
+    # Year distribution (0 marks an unknown year)
+    distinct_years, year_totals = np.unique(years[years > 0], return_counts=True)
+    year_counts = dict(zip(distinct_years.tolist(), year_totals.tolist()))
     
-    return jsonify({
+    return {
         'total_count': total_count,
         'content_type_distribution': {
             'movies': movies_count,
@@ -1371,13 +1537,14 @@ def get_stats():
             'bollywood': bollywood_count,
             'south_indian': south_indian_count
         },
-        'top_genres': dict(sorted(genre_counts.items(), key=lambda x: x[1], reverse=True)[:15]),
+        'top_genres': dict(genre_counts.most_common(15)),
         'year_distribution': dict(sorted(year_counts.items()))
-    })
+    }
 
 # Initialize recommender when script runs
 print("Initializing Movie Recommender...")
 recommender = MovieRecommender()
+_build_caches()
 
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file